@@ -1,10 +1,13 @@
 ﻿"""
     Takes four fluid textures (single step) and creates the animated strips for the fluid.
+    Requires NumPy and Pillow, where Pillow-SIMD can be installed as a drop-in replacement for faster PNG encoding.
 """
 
-import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 from PIL import Image
 
 anim_frames = 16
@@ -12,43 +15,54 @@ resolution = 32
 r2a = resolution // anim_frames
 
 
-def move_image(original, amount) -> Image:
-    moved = original.copy()
-    for x in range(0, original.width):
-        for y in range(0, original.height):
-            moved.putpixel((x, y), original.getpixel((x, (y - amount) % original.height)))
+def move_image(original, amount, moved):
+    split = original.shape[0] - amount % original.shape[0]
+    moved[:-split] = original[split:]
+    moved[-split:] = original[:split]
 
-    return moved
 
+def create_strip(base_image, shifts) -> Image:
+    base = np.asarray(base_image.convert("RGBA"))
+    height, width, channels = base.shape
 
-def create_strip(base_image, spread_fn):
-    strip = Image.new("RGBA", (base_image.width * anim_frames, base_image.height))
+    strip = np.empty((height, width * anim_frames, channels), dtype=np.uint8)
     for x in range(0, anim_frames):
-        strip.paste(move_image(base_image, spread_fn(x) * r2a), (x * base_image.width, 0))
-    return strip
+        move_image(base, shifts[x], strip[:, x * width:(x + 1) * width])
 
+    return Image.fromarray(strip, "RGBA")
 
-fluid_name = sys.argv[1]
 
-textures = [f'{fluid_name}_moving.png',
-            f'{fluid_name}_moving_side.png',
-            f'{fluid_name}_static.png',
-            f'{fluid_name}_static_side.png']
+def create_spread(max_spread) -> np.ndarray:
+    spread = np.sin(np.arange(anim_frames) / (anim_frames - 1) * np.pi) * max_spread
+    return spread.astype(int) * r2a
 
 
-def create_spread_function(max_spread):
-    return lambda y: int(math.sin(y * 1 / (anim_frames - 1) * math.pi) * max_spread)
+def process_texture(texture, shifts):
+    with Image.open(texture) as image:
+        image.load()
 
+    if (image.width, image.height) != (resolution, resolution):
+        image = image.crop((0, 0, resolution, resolution))
 
-spread_functions = [create_spread_function(6),
-                    lambda y: y,
-                    create_spread_function(3),
-                    create_spread_function(3)]
+    result = create_strip(image, shifts)
 
-for texture, fn in zip(textures, spread_functions):
-    with Image.open(texture) as image:
-        if (image.width, image.height) != (resolution, resolution):
-            image = image.crop((0, 0, resolution, resolution))
+    temporary = texture + ".tmp"
+    result.save(temporary, format="PNG", optimize=False, compress_level=1)
+    os.replace(temporary, texture)
+
+
+if __name__ == "__main__":
+    fluid_name = sys.argv[1]
+
+    textures = [f'{fluid_name}_moving.png',
+                f'{fluid_name}_moving_side.png',
+                f'{fluid_name}_static.png',
+                f'{fluid_name}_static_side.png']
+
+    spreads = [create_spread(6),
+               np.arange(anim_frames) * r2a,
+               create_spread(3),
+               create_spread(3)]
 
-        result = create_strip(image, fn)
-        result.save(texture)
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_texture, textures, spreads))
@@ -5,74 +5,78 @@
 
 import bpy
 import json
+import numpy as np
 import os
-from json import JSONEncoder
 
 PATH = os.path.expanduser("~\\Desktop\\")
 
+obj = bpy.context.view_layer.objects.active
+mesh = obj.data
 
-class Vertex:
-    def __init__(self, world_coordinates, uv_coordinates):
-        self.X = round(world_coordinates.x, 5)
-        self.Y = round(world_coordinates.z, 5)
-        self.Z = round(world_coordinates.y, 5)
-        self.U = round(abs(1 - uv_coordinates.x), 4)
-        self.V = round(uv_coordinates.y, 4)
+tex_names = []
+tex_name_to_id = {}
+quads = []
 
+coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+mesh.vertices.foreach_get("co", coordinates)
+coordinates = coordinates.reshape(-1, 3).astype(np.float64)
+positions = np.round(coordinates[:, [0, 2, 1]], 5).tolist()
 
-class Quad:
-    def __init__(self, texture_id, vertices):
-        self.TextureId = texture_id
-        self.Vert0 = vertices[0]
-        self.Vert1 = vertices[1]
-        self.Vert2 = vertices[2]
-        self.Vert3 = vertices[3]
+uv_layer = mesh.uv_layers.active
+if uv_layer is None:
+    raise Exception("An active UV map is required!")
 
+uv_data = uv_layer.data
+uv_coordinates = np.empty(len(uv_data) * 2, dtype=np.float32)
+uv_data.foreach_get("uv", uv_coordinates)
+uv_coordinates = uv_coordinates.reshape(-1, 2).astype(np.float64)
+uvs = np.column_stack([np.abs(1 - uv_coordinates[:, 0]), uv_coordinates[:, 1]])
+uvs = np.round(uvs, 4).tolist()
 
-class Model:
-    def __init__(self, texture_names, all_quads):
-        self.TextureNames = texture_names
-        self.Quads = all_quads
+polygons = mesh.polygons
 
+loop_totals = np.empty(len(polygons), dtype=np.int32)
+polygons.foreach_get("loop_total", loop_totals)
 
-class ModelEncoder(JSONEncoder):
-    def default(self, o):
-        return o.__dict__
+if (loop_totals != 4).any():
+    raise Exception("Only quads are supported!")
 
+loop_starts = np.empty(len(polygons), dtype=np.int32)
+polygons.foreach_get("loop_start", loop_starts)
+loop_starts = loop_starts.tolist()
 
-obj = bpy.context.view_layer.objects.active
-mesh = obj.data
+material_indices = np.empty(len(polygons), dtype=np.int32)
+polygons.foreach_get("material_index", material_indices)
+material_indices = material_indices.tolist()
 
-tex_names = []
-quads = []
+loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+mesh.loops.foreach_get("vertex_index", loop_vertices)
+loop_vertices = loop_vertices.tolist()
 
-for face in mesh.polygons:
+slots = obj.material_slots
 
-    if len(face.vertices) != 4:
-        raise Exception("Only quads are supported!")
+for loop_start, material_index in zip(loop_starts, material_indices):
 
-    mat = obj.material_slots[face.material_index].material
+    mat = slots[material_index].material
     if mat is not None:
         matName = mat.name
     else:
         matName = "none"
 
-    if matName not in tex_names:
+    if matName not in tex_name_to_id:
+        tex_name_to_id[matName] = len(tex_names)
         tex_names.append(matName)
 
-    verts = []
+    quad = {"TextureId": tex_name_to_id[matName]}
 
-    for vertex_index, loop_index in zip(face.vertices, face.loop_indices):
-        xyz = mesh.vertices[vertex_index].co
-        uv = mesh.uv_layers.active.data[loop_index].uv
-        norm = face.normal
-        verts.append(Vertex(xyz, uv))
+    for number, loop_index in enumerate(range(loop_start, loop_start + 4)):
+        x, y, z = positions[loop_vertices[loop_index]]
+        u, v = uvs[loop_index]
+        quad[f"Vert{number}"] = {"X": x, "Y": y, "Z": z, "U": u, "V": v}
 
-    quads.append(Quad(tex_names.index(matName), verts))
+    quads.append(quad)
 
-model = Model(tex_names, quads)
-json = json.dumps(model, indent=4, cls=ModelEncoder)
+model = {"TextureNames": tex_names, "Quads": quads}
 
-file = open(PATH + obj.name + ".json", "w+")
-file.write(json)
-file.close()
+with open(os.path.join(PATH, obj.name + ".json"), "w") as file:
+    json.dump(model, file, indent=4)
@@ -4,22 +4,30 @@
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from PIL import Image
 
 alpha = int(255 * 0.25)
 
 
-def process_image(current_image):
-    for x in range(current_image.size[0]):
-        for y in range(current_image.size[1]):
-            pixel = current_image.getpixel((x, y))
-            current_image.putpixel((x, y), (pixel[0], pixel[1], pixel[2], alpha))
+def process_image(current_image) -> Image:
+    pixels = np.array(current_image.convert("RGBA"))
+    pixels[:, :, 3] = alpha
+
+    return Image.fromarray(pixels, "RGBA")
 
 
-for arg in sys.argv[1:]:
+def process_file(arg):
     try:
         with Image.open(arg) as image:
-            process_image(image)
-            image.save(arg)
+            result = process_image(image)
+        result.save(arg)
     except IOError:
         print(f"Error: Could not open file {arg}")
+
+
+if __name__ == "__main__":
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_file, sys.argv[1:]))